@@ -7,9 +7,23 @@ bl_info = {
 }
 
 import bpy
+import hashlib
+import json
+import numpy as np
 import os
-from bpy.props import StringProperty, BoolProperty, PointerProperty
+import queue
+import re
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import zlib
+from bpy.props import StringProperty, BoolProperty, IntProperty, EnumProperty, PointerProperty
 from bpy.types import Operator, Panel, PropertyGroup
+from bpy_extras.object_utils import world_to_camera_view
+from mathutils import Vector
 
 class StaticSequenceExporterProperties(PropertyGroup):
     render_collection: StringProperty(
@@ -33,45 +47,534 @@ class StaticSequenceExporterProperties(PropertyGroup):
         description="Toggle between Eevee and Cycles",
         default=False
     )
+    compute_device_type: EnumProperty(
+        name="Device",
+        description="Compute device used when rendering with Cycles",
+        items=[
+            ('PREFERENCES', "Use Preferences", "Keep the device set in the preferences and the scene"),
+            ('NONE', "CPU", "Render on the CPU"),
+            ('CUDA', "CUDA", "Render on NVIDIA GPUs using CUDA"),
+            ('OPTIX', "OptiX", "Render on NVIDIA GPUs using OptiX"),
+            ('HIP', "HIP", "Render on AMD GPUs using HIP"),
+            ('METAL', "Metal", "Render on Apple GPUs using Metal"),
+        ],
+        default='PREFERENCES'
+    )
+    samples: IntProperty(
+        name="Samples",
+        description="Number of samples per pixel when rendering with Cycles",
+        default=128,
+        min=1
+    )
+    use_denoising: BoolProperty(
+        name="Denoise",
+        description="Denoise the Cycles render",
+        default=True
+    )
     transparent_film: BoolProperty(
         name="Transparent Film",
         description="Toggle between transparent and non-transparent film",
         default=True
     )
+    output_format: EnumProperty(
+        name="Output Format",
+        description="File format of the rendered images",
+        items=[
+            ('PNG', "PNG", "Write PNG images"),
+            ('EXR', "OpenEXR", "Write uncompressed full float OpenEXR images"),
+            ('EXR_HALF', "OpenEXR Half", "Write uncompressed half float OpenEXR images"),
+        ],
+        default='PNG'
+    )
+    async_write: BoolProperty(
+        name="Write Images in Background",
+        description="Write PNGs on a background thread while the next object renders (reads the image from a compositor Viewer node). Only used for 8-bit RGBA PNG output with the Standard view transform and no look, exposure or gamma, as the image is written without color management",
+        default=False
+    )
+    enable_frustum_cull: BoolProperty(
+        name="Skip Objects Outside Camera",
+        description="Don't render objects whose bounds lie entirely outside the camera's view",
+        default=False
+    )
+    use_object_border: BoolProperty(
+        name="Crop Render to Object",
+        description="Only render the region of the frame covered by each object's bounds (shadows and reflections outside of it are lost)",
+        default=False
+    )
+    skip_unchanged: BoolProperty(
+        name="Skip Unchanged Objects",
+        description="Don't render objects whose image is up to date with the render manifest in the output path",
+        default=False
+    )
     camera_object: PointerProperty(
         name="Camera",
         description="Select the camera object",
         type=bpy.types.Object,
         poll=lambda self, obj: obj.type == 'CAMERA'
     )
+    num_processes: IntProperty(
+        name="Processes",
+        description="Number of background Blender processes (one per GPU) used for parallel rendering",
+        default=2,
+        min=1
+    )
+
+# Per-ray visibility flags Cycles uses to skip an object during ray traversal
+RAY_VISIBILITY_FLAGS = (
+    "visible_camera",
+    "visible_diffuse",
+    "visible_glossy",
+    "visible_transmission",
+    "visible_volume_scatter",
+    "visible_shadow",
+)
+
+def apply_visibility(obj, flags, states):
+    # Only write flags that differ, every write tags the depsgraph
+    for flag, value in zip(flags, states):
+        if getattr(obj, flag) != value:
+            setattr(obj, flag, value)
+
+def get_visibility_states(objects, flags):
+    # Read each flag of every object with a single foreach_get call,
+    # rows are flags and columns are objects
+    states = np.empty((len(flags), len(objects)), dtype=bool)
+    for row, flag in zip(states, flags):
+        objects.foreach_get(flag, row)
+    return states
+
+def restore_visibility(snapshot, flags):
+    # snapshot holds (object, states) pairs, objects deleted since it was
+    # taken are skipped
+    for obj, states in snapshot:
+        try:
+            apply_visibility(obj, flags, states)
+        except ReferenceError:
+            continue
+
+def enable_gpu_devices(context, compute_device_type):
+    # Returns False when Cycles has no device of the given type
+    addon = context.preferences.addons.get('cycles')
+    if addon is None:
+        return False
+
+    prefs = addon.preferences
+    try:
+        prefs.compute_device_type = compute_device_type
+    except TypeError:
+        return False
+
+    prefs.get_devices()
+    devices = [d for d in prefs.devices if d.type == compute_device_type]
+    for device in devices:
+        device.use = True
+    return bool(devices)
+
+# Sidecar file in the output path recording the hash each image was rendered from
+MANIFEST_NAME = ".render_manifest.json"
+
+# Node properties that only affect the node editor, not the render
+NODE_UI_PROPERTIES = {"location", "width", "height", "dimensions", "select", "hide", "show_options", "show_preview", "show_texture"}
+
+def plain_value(value):
+    # Convert an RNA value into something with a stable repr, IDs are
+    # referenced by name
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, bpy.types.ID):
+        return value.name
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(value))
+    try:
+        return tuple(plain_value(v) for v in value)
+    except TypeError:
+        return repr(value)
+
+def rna_values(struct, skip=()):
+    # Every setting of a struct, nested structs other than IDs are skipped
+    values = []
+    for prop in struct.bl_rna.properties:
+        identifier = prop.identifier
+        if identifier == 'rna_type' or identifier in skip or prop.type == 'COLLECTION':
+            continue
+        value = getattr(struct, identifier, None)
+        if prop.type == 'POINTER' and not (value is None or isinstance(value, bpy.types.ID)):
+            continue
+        values.append((identifier, plain_value(value)))
+    return values
+
+def node_tree_values(tree):
+    if tree is None:
+        return None
+    nodes = [
+        (
+            node.bl_idname,
+            node.name,
+            rna_values(node, NODE_UI_PROPERTIES),
+            [(socket.identifier, plain_value(getattr(socket, 'default_value', None))) for socket in node.inputs],
+            node_tree_values(getattr(node, 'node_tree', None)),
+        )
+        for node in tree.nodes
+    ]
+    links = [
+        (link.from_node.name, link.from_socket.identifier, link.to_node.name, link.to_socket.identifier)
+        for link in tree.links
+    ]
+    return nodes, links
+
+def material_values(obj):
+    return [
+        (slot.material.name, rna_values(slot.material), node_tree_values(slot.material.node_tree)) if slot.material else None
+        for slot in obj.material_slots
+    ]
+
+def scene_hash_key(scene, lighting_objs):
+    # Settings shared by every render, changing any of them invalidates all images
+    render = scene.render
+    camera = scene.camera
+    world = scene.world
+    image_settings = render.image_settings
+    key = (
+        render.engine,
+        render.resolution_x,
+        render.resolution_y,
+        render.resolution_percentage,
+        render.film_transparent,
+        image_settings.file_format,
+        image_settings.color_depth,
+        image_settings.exr_codec,
+        rna_values(scene.cycles) if render.engine == 'CYCLES' else rna_values(scene.eevee),
+        rna_values(scene.view_settings),
+        scene.display_settings.display_device,
+        scene.static_sequence_exporter_props.use_object_border,
+        (rna_values(camera.data), [tuple(row) for row in camera.matrix_world]) if camera else None,
+        (rna_values(world), node_tree_values(world.node_tree)) if world else None,
+        sorted(
+            (
+                o.name,
+                [tuple(row) for row in o.matrix_world],
+                rna_values(o.data) if o.data else None,
+                node_tree_values(getattr(o.data, 'node_tree', None)),
+                material_values(o),
+            )
+            for o in lighting_objs
+        ),
+    )
+    return repr(key).encode()
+
+def object_hash(obj, depsgraph, scene_key):
+    # Hash the evaluated mesh, so modifiers, shape keys and armatures count
+    obj_eval = obj.evaluated_get(depsgraph)
+    mesh = obj_eval.to_mesh()
+    try:
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", vertex_indices)
+    finally:
+        obj_eval.to_mesh_clear()
+    materials = repr(material_values(obj))
+
+    h = hashlib.blake2b(scene_key, digest_size=16)
+    h.update(co.tobytes())
+    h.update(vertex_indices.tobytes())
+    h.update(np.array(obj.matrix_world, dtype=np.float32).tobytes())
+    h.update(materials.encode())
+    return h.hexdigest()
+
+def shard_manifest_path(manifest_path, shard_index):
+    # Each parallel shard writes its own manifest, merged by the parent
+    root, ext = os.path.splitext(manifest_path)
+    return f"{root}.{shard_index}{ext}"
+
+def load_manifest(manifest_path):
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(manifest_path, manifest):
+    # Write to a temporary file first so readers never see a partial file
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, indent=4)
+    os.replace(temp_path, manifest_path)
+
+def merge_shard_manifests(manifest_path, shard_count):
+    manifest = load_manifest(manifest_path)
+    for i in range(shard_count):
+        path = shard_manifest_path(manifest_path, i)
+        if os.path.exists(path):
+            manifest.update(load_manifest(path))
+            os.remove(path)
+    save_manifest(manifest_path, manifest)
+
+def project_bound_box(obj, cam, scene):
+    # world_to_camera_view maps the frame to [0, 1] on x and y, with z being
+    # the distance in front of the camera
+    return [world_to_camera_view(scene, cam, obj.matrix_world @ Vector(corner)) for corner in obj.bound_box]
+
+def in_frustum(obj, cam, scene):
+    corners = project_bound_box(obj, cam, scene)
+    clip_start = cam.data.clip_start
+    clip_end = cam.data.clip_end
+
+    in_front = [c for c in corners if c.z > clip_start]
+    if not in_front:
+        return False
+
+    # Projections of corners behind the camera are mirrored, so keep any
+    # object crossing the near plane
+    if len(in_front) < len(corners):
+        return True
+
+    if min(c.z for c in corners) > clip_end:
+        return False
+
+    return (
+        max(c.x for c in corners) >= 0.0 and min(c.x for c in corners) <= 1.0 and
+        max(c.y for c in corners) >= 0.0 and min(c.y for c in corners) <= 1.0
+    )
+
+def compute_border(obj, cam, scene):
+    # Returns None to render the full frame, when the object crosses the
+    # camera plane (its projected bounds can't be trusted then) or lies
+    # outside of the frame
+    corners = project_bound_box(obj, cam, scene)
+    if any(c.z <= cam.data.clip_start for c in corners):
+        return None
+
+    # Pad by a few pixels so antialiased edges aren't cut off
+    pad_x = 8 / scene.render.resolution_x
+    pad_y = 8 / scene.render.resolution_y
+    min_x = min(1.0, max(0.0, min(c.x for c in corners) - pad_x))
+    min_y = min(1.0, max(0.0, min(c.y for c in corners) - pad_y))
+    max_x = max(0.0, min(1.0, max(c.x for c in corners) + pad_x))
+    max_y = max(0.0, min(1.0, max(c.y for c in corners) + pad_y))
+    if min_x >= max_x or min_y >= max_y:
+        return None
+
+    return min_x, min_y, max_x, max_y
+
+def add_viewer_node(scene):
+    # Unlike the Render Result, a Viewer node's image pixels can be read
+    # back from Python, so route the composited image into one
+    scene.use_nodes = True
+    tree = scene.node_tree
+
+    composite = next((n for n in tree.nodes if n.type == 'COMPOSITE'), None)
+    if composite and composite.inputs['Image'].is_linked:
+        source = composite.inputs['Image'].links[0].from_socket
+    else:
+        render_layers = next((n for n in tree.nodes if n.type == 'R_LAYERS'), None)
+        if not render_layers:
+            render_layers = tree.nodes.new('CompositorNodeRLayers')
+        source = render_layers.outputs['Image']
+
+    # The 'Viewer Node' image shows the active viewer, so make it this one
+    viewer = tree.nodes.new('CompositorNodeViewer')
+    viewer.use_alpha = True
+    tree.links.new(source, viewer.inputs['Image'])
+    tree.nodes.active = viewer
+    return viewer
+
+def write_png(filepath, pixels, compression):
+    # Viewer node pixels are linear, premultiplied RGBA stored bottom row
+    # first, convert them to a straight alpha sRGB 8-bit PNG
+    rgba = pixels[::-1].copy()
+    alpha = rgba[..., 3:]
+    np.divide(rgba[..., :3], alpha, out=rgba[..., :3], where=alpha > 0)
+    rgb = np.clip(rgba[..., :3], 0.0, 1.0)
+    rgba[..., :3] = np.where(rgb <= 0.0031308, rgb * 12.92, 1.055 * rgb ** (1 / 2.4) - 0.055)
+    data = np.round(np.clip(rgba, 0.0, 1.0) * 255).astype(np.uint8)
+
+    # Each scanline is prefixed with filter type 0 (none)
+    height, width = data.shape[:2]
+    scanlines = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    scanlines[:, 1:] = data.reshape(height, -1)
+
+    def chunk(tag, body):
+        return struct.pack(">I", len(body)) + tag + body + struct.pack(">I", zlib.crc32(tag + body))
+
+    with open(filepath, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(scanlines.tobytes(), compression * 9 // 100)))
+        f.write(chunk(b"IEND", b""))
+
+def async_write_unsupported(scene):
+    # write_png only converts to sRGB, returns why the scene's output
+    # settings can't be matched or None if they can
+    view_settings = scene.view_settings
+    image_settings = scene.render.image_settings
+    if not scene.render.use_compositing:
+        return "compositing is disabled, so the Viewer node isn't updated"
+    if scene.display_settings.display_device != 'sRGB':
+        return "the display device isn't sRGB"
+    if view_settings.view_transform != 'Standard' or view_settings.look != 'None':
+        return "the view transform isn't Standard without a look"
+    if view_settings.exposure != 0.0 or view_settings.gamma != 1.0 or view_settings.use_curve_mapping:
+        return "exposure, gamma or curves are set"
+    if image_settings.color_depth != '8' or image_settings.color_mode != 'RGBA':
+        return "the PNG isn't 8-bit RGBA"
+    return None
+
+def record_worker(record_queue, rendered, errors):
+    # Write queued renders to disk until a None entry is received, the hash
+    # of each image is only recorded once it has been written
+    while True:
+        item = record_queue.get()
+        if item is None:
+            return
+        name, obj_hash, filepath, pixels, compression = item
+        try:
+            write_png(filepath, pixels, compression)
+        except Exception as e:
+            errors.append(f"Failed to write '{filepath}': {e}")
+        else:
+            rendered[name] = obj_hash
 
 class STATICSEQUENCE_OT_export(Operator):
     bl_idname = "static_sequence.export"
     bl_label = "Begin Render Sequence"
+
+    shard_index: IntProperty(
+        name="Shard Index",
+        description="Index of the slice of meshes rendered by this run",
+        default=0,
+        min=0,
+        options={'HIDDEN', 'SKIP_SAVE'}
+    )
+    shard_count: IntProperty(
+        name="Shard Count",
+        description="Number of slices the meshes are split into",
+        default=1,
+        min=1,
+        options={'HIDDEN', 'SKIP_SAVE'}
+    )
+
+    # Set while a sequence is running, as a second run would snapshot the
+    # scene in its hidden state
+    _is_running = False
+
+    @classmethod
+    def poll(cls, context):
+        return not STATICSEQUENCE_OT_export._is_running
     
-    def execute(self, context):
-        props = context.scene.static_sequence_exporter_props
+    def _preflight(self, meshes, output_path, render):
+        # Validate every output before rendering anything, returns the
+        # filepath of each mesh and a list of errors
+        filepaths = {}
+        errors = []
+        used = {}
+        for obj in meshes:
+            # Replace characters that are illegal in Windows filenames, and
+            # '#' which Blender replaces with the frame number
+            filename = re.sub(r'[<>:"/\\|?*#]', '_', obj.name) + render.file_extension
+            filepath = os.path.join(output_path, filename)
+
+            # Compare case-insensitively only where the OS does
+            key = os.path.normcase(filepath)
+            if key in used:
+                errors.append(f"'{obj.name}' and '{used[key]}' would both be written to {filename}.")
+            used[key] = obj.name
+            filepaths[obj.name] = filepath
+
+        if not os.access(output_path, os.W_OK):
+            errors.append(f"Output path '{output_path}' is not writable.")
+        else:
+            # Only images of this run's slice that don't exist yet need new
+            # space, uncompressed size is an upper bound for every format
+            new_images = sum(
+                not os.path.exists(filepaths[obj.name])
+                for obj in meshes[self.shard_index::self.shard_count]
+            )
+            image_settings = render.image_settings
+            if image_settings.file_format == 'OPEN_EXR':
+                bytes_per_channel = 2 if image_settings.color_depth == '16' else 4
+            else:
+                bytes_per_channel = 2 if image_settings.color_depth == '16' else 1
+            width = render.resolution_x * render.resolution_percentage // 100
+            height = render.resolution_y * render.resolution_percentage // 100
+            estimated_bytes = width * height * 4 * bytes_per_channel * new_images
+            free_bytes = shutil.disk_usage(output_path).free
+            if free_bytes < estimated_bytes:
+                self.report({'WARNING'}, f"Possibly not enough disk space in '{output_path}', up to {estimated_bytes // 2**20} MB needed but {free_bytes // 2**20} MB free.")
+
+        return filepaths, errors
+
+    def _setup(self, context):
+        # Configure the scene and prepare the sequence, returns False if it
+        # can't be rendered
+        # Keep the scene and view layer, the user may switch scenes while
+        # the modal operator runs
+        scene = context.scene
+        render = scene.render
+        props = scene.static_sequence_exporter_props
+        self._scene = scene
+        self._view_layer = context.view_layer
         
         collection_name = props.render_collection
         lighting_collection_name = props.lighting_collection
         output_path = props.output_path
         use_cycles = props.use_cycles
+        compute_device_type = props.compute_device_type
         transparent_film = props.transparent_film
+        output_format = props.output_format
+        skip_unchanged = props.skip_unchanged
         camera_name = props.camera_object.name if props.camera_object else None
+
+        self._use_cycles = use_cycles
+        self._async_write = props.async_write and output_format == 'PNG'
+        self._enable_frustum_cull = props.enable_frustum_cull
+        self._use_object_border = props.use_object_border
         
         # Set the render engine
-        bpy.context.scene.render.engine = 'CYCLES' if use_cycles else 'BLENDER_EEVEE'
+        render.engine = 'CYCLES' if use_cycles else 'BLENDER_EEVEE'
+
+        # Configure the Cycles device and sampling once for the whole sequence
+        if use_cycles:
+            scene.cycles.samples = props.samples
+            scene.cycles.use_denoising = props.use_denoising
+            # 'PREFERENCES' leaves the add-on preferences and scene device as they are
+            if compute_device_type != 'PREFERENCES':
+                scene.cycles.device = 'CPU'
+            if compute_device_type not in {'PREFERENCES', 'NONE'}:
+                if enable_gpu_devices(context, compute_device_type):
+                    scene.cycles.device = 'GPU'
+                else:
+                    self.report({'WARNING'}, f"No {compute_device_type} device found, rendering on the CPU.")
         
         # Enable transparency if selected
-        bpy.context.scene.render.film_transparent = transparent_film
+        render.film_transparent = transparent_film
+        
+        # Set the output format, EXR is written without compression as
+        # encoding time dominates for batch renders
+        image_settings = render.image_settings
+        if output_format == 'PNG':
+            image_settings.file_format = 'PNG'
+            # Set the depth explicitly, a previous EXR run leaves it at 16 bit
+            image_settings.color_depth = '8'
+        else:
+            image_settings.file_format = 'OPEN_EXR'
+            image_settings.color_depth = '16' if output_format == 'EXR_HALF' else '32'
+            image_settings.exr_codec = 'NONE'
+        
+        # Fall back to writing with Blender when the background writer can't
+        # match the output settings
+        if self._async_write:
+            reason = async_write_unsupported(scene)
+            if reason:
+                self.report({'WARNING'}, f"Writing images in the foreground, {reason}.")
+                self._async_write = False
         
         # Set the camera if provided
         if camera_name:
-            bpy.context.scene.camera = bpy.data.objects[camera_name]
+            scene.camera = bpy.data.objects[camera_name]
         
-        # Ensure the output path ends with a slash
-        if not output_path.endswith(('/', '\\')):
-            output_path += '/'
+        # Resolve relative paths and normalize the separators
+        output_path = os.path.normpath(bpy.path.abspath(output_path))
         
         # Check if the render collection exists
         render_collection = bpy.data.collections.get(collection_name)
@@ -79,45 +582,383 @@ class STATICSEQUENCE_OT_export(Operator):
 
         if not render_collection:
             self.report({'ERROR'}, f"Collection '{collection_name}' not found.")
-            return {'CANCELLED'}
+            return False
         
         # Check if the output path is valid
         if not os.path.exists(output_path):
             self.report({'ERROR'}, f"Output path '{output_path}' does not exist.")
-            return {'CANCELLED'}
+            return False
         
-        # Create a set of all objects in the lighting collection for quick access
-        lighting_objs = set(o for o in lighting_collection.objects) if lighting_collection else set()
+        # Collect the lighting objects, keyed by pointer for quick membership
+        # tests (plain int hashing instead of going through RNA)
+        lighting_objs = list(lighting_collection.objects) if lighting_collection else []
+        self._lighting_ptrs = frozenset(o.as_pointer() for o in lighting_objs)
         
-        # Iterate over objects in the render collection
-        for obj in render_collection.objects:
-            if obj.type == 'MESH':
-                # Hide all objects not in the lighting collection
-                for other_obj in bpy.context.scene.objects:
-                    other_obj.hide_render = other_obj not in lighting_objs and other_obj != obj
+        # Filter the meshes once into a plain sequence
+        meshes = tuple(o for o in render_collection.objects if o.type == 'MESH')
+
+        # Check all outputs up front, so a bad name doesn't stop the sequence
+        # halfway through
+        self._filepaths, errors = self._preflight(meshes, output_path, render)
+        if errors:
+            for error in errors:
+                self.report({'ERROR'}, error)
+            return False
+
+        # Only render this run's slice of the meshes
+        self._meshes = meshes[self.shard_index::self.shard_count]
+        self._remaining = iter(self._meshes)
+        self._prev = None
+        self._camera = scene.camera
 
-                # Ensure the current object is visible
-                obj.hide_render = False
+        # Load the hashes of previously rendered objects
+        self._manifest_path = os.path.join(output_path, MANIFEST_NAME)
+        self._manifest = load_manifest(self._manifest_path) if skip_unchanged else {}
+        self._scene_key = scene_hash_key(scene, lighting_objs)
+        self._rendered = {}
 
-                # Update the scene
-                bpy.context.view_layer.update()
+        # Snapshot the scene's objects once instead of walking the RNA
+        # collection for every pass over them
+        self._all_scene_objs = list(scene.objects)
 
-                # Set the render filepath
-                filepath = f'{output_path}{obj.name}.png'
-                bpy.context.scene.render.filepath = filepath
+        # Cycles keeps objects hidden by ray visibility in the BVH, so flipping
+        # these flags avoids the depsgraph rebuild that hide_render triggers
+        flags = RAY_VISIBILITY_FLAGS if use_cycles else ("hide_render",)
+        self._flags = flags
+        self._hidden_states = (False,) * len(flags) if use_cycles else (True,)
 
-                # Render the image
-                bpy.ops.render.render(write_still=True)
+        # Remember the visibility of every object that gets toggled
+        # (everything but lighting), as the scene may change while the
+        # modal operator runs
+        states = get_visibility_states(scene.objects, flags)
+        self._visibility_snapshot = [
+            (o, tuple(states[:, column].tolist()))
+            for column, o in enumerate(self._all_scene_objs)
+            if o.as_pointer() not in self._lighting_ptrs
+        ]
 
-                # Debug: Confirm rendering
-                self.report({'INFO'}, f"Rendered {obj.name} to {filepath}")
+        # Objects are shown with their own ray visibility with Cycles, so
+        # per-object settings like disabled shadows are kept
+        self._shown_states = {
+            o.as_pointer(): obj_states if use_cycles else (False,)
+            for o, obj_states in self._visibility_snapshot
+        }
 
-        # Restore visibility for all objects
-        for obj in bpy.context.scene.objects:
-            obj.hide_render = False
+        # Everything below changes the scene or preferences, _restore only
+        # undoes the steps whose saved state has been set
+        STATICSEQUENCE_OT_export._is_running = True
+        self._use_persistent_data = None
+        self._use_global_undo = None
+        self._border_settings = None
+        self._viewer = None
+        self._writer = None
+        self._write_errors = []
 
-        self.report({'INFO'}, "Rendering complete.")
+        try:
+            # Keep Cycles' scene data and BVH between renders, only visibility
+            # changes from one shot to the next
+            self._use_persistent_data = render.use_persistent_data
+            render.use_persistent_data = True
+
+            # Skip undo pushes for the many scene changes made while rendering
+            edit_prefs = context.preferences.edit
+            self._use_global_undo = edit_prefs.use_global_undo
+            edit_prefs.use_global_undo = False
+
+            # Render only the region covered by each object, keeping the full
+            # frame size so the images still line up
+            if self._use_object_border:
+                self._border_settings = (
+                    render.use_border, render.use_crop_to_border,
+                    render.border_min_x, render.border_min_y,
+                    render.border_max_x, render.border_max_y,
+                )
+                render.use_crop_to_border = False
+
+            # Hand finished renders to a background thread for writing, so disk
+            # I/O overlaps with the next render
+            if self._async_write:
+                self._use_nodes = scene.use_nodes
+                self._viewer = add_viewer_node(scene)
+
+                # Bounded, as every queued full float frame can take 100+ MB
+                self._record_queue = queue.Queue(maxsize=4)
+                self._writer = threading.Thread(target=record_worker, args=(self._record_queue, self._rendered, self._write_errors))
+                self._writer.start()
+
+                # Buffer the Viewer node's pixels are bulk copied into
+                width = render.resolution_x * render.resolution_percentage // 100
+                height = render.resolution_y * render.resolution_percentage // 100
+                self._pixel_buf = np.empty(width * height * 4, dtype=np.float32)
+
+            # Hide every object not in the lighting collection once up front,
+            # so each render only has to flip two objects
+            for obj, obj_states in self._visibility_snapshot:
+                if obj_states != self._hidden_states:
+                    apply_visibility(obj, flags, self._hidden_states)
+
+            # Evaluate the scene once before the first render
+            scene.frame_set(scene.frame_current)
+        except Exception:
+            self._restore(context)
+            raise
+
+        return True
+
+    def _render_next(self, context):
+        # Render the next mesh that needs it, returns False once all are done
+        scene = self._scene
+        render = scene.render
+        camera = self._camera
+        flags = self._flags
+
+        for obj in self._remaining:
+            # Skip objects the camera can't see
+            if self._enable_frustum_cull and camera and not in_frustum(obj, camera, scene):
+                self.report({'INFO'}, f"Skipped {obj.name}, outside of camera view")
+                continue
+
+            # Skip objects whose image is already up to date
+            filepath = self._filepaths[obj.name]
+            obj_hash = object_hash(obj, self._view_layer.depsgraph, self._scene_key)
+            if self._manifest.get(obj.name) == obj_hash and os.path.exists(filepath):
+                self.report({'INFO'}, f"Skipped {obj.name}, {filepath} is up to date")
+                continue
+
+            # Hide the previously rendered object and show the current
+            # one, back to back so they land in a single update
+            prev = self._prev
+            if prev is not None and prev.as_pointer() in self._shown_states:
+                apply_visibility(prev, flags, self._hidden_states)
+            shown_states = self._shown_states.get(obj.as_pointer())
+            if shown_states is not None:
+                apply_visibility(obj, flags, shown_states)
+            self._prev = obj
+
+            # Set the render filepath
+            render.filepath = filepath
+
+            # Fit the render border to the object
+            if self._use_object_border:
+                border = compute_border(obj, camera, scene) if camera else None
+                render.use_border = border is not None
+                if border:
+                    (render.border_min_x, render.border_min_y,
+                     render.border_max_x, render.border_max_y) = border
+
+            # Update the scene right before rendering (ray visibility
+            # changes don't need this)
+            if not self._use_cycles:
+                self._view_layer.update()
+
+            # Render the image
+            if self._async_write:
+                bpy.ops.render.render(write_still=False, scene=scene.name, layer=self._view_layer.name)
+                image = bpy.data.images['Viewer Node']
+                width, height = image.size
+                if self._pixel_buf.size != width * height * 4:
+                    self._pixel_buf = np.empty(width * height * 4, dtype=np.float32)
+                image.pixels.foreach_get(self._pixel_buf)
+
+                # The buffer is reused for the next render, so queue a copy
+                pixels = self._pixel_buf.reshape(height, width, 4).copy()
+                self._record_queue.put((obj.name, obj_hash, filepath, pixels, render.image_settings.compression))
+            else:
+                bpy.ops.render.render(write_still=True, scene=scene.name, layer=self._view_layer.name)
+                self._rendered[obj.name] = obj_hash
+
+            # Debug: Confirm rendering
+            self.report({'INFO'}, f"Rendered {obj.name} to {filepath}")
+            return True
+
+        return False
+
+    def _restore(self, context):
+        # Undo the temporary scene changes made by _setup
+        scene = self._scene
+        render = scene.render
+
+        try:
+            if self._use_persistent_data is not None:
+                render.use_persistent_data = self._use_persistent_data
+            if self._use_global_undo is not None:
+                context.preferences.edit.use_global_undo = self._use_global_undo
+
+            if self._border_settings is not None:
+                (render.use_border, render.use_crop_to_border,
+                 render.border_min_x, render.border_min_y,
+                 render.border_max_x, render.border_max_y) = self._border_settings
+
+            try:
+                # Restore the visibility the toggled objects had before
+                restore_visibility(self._visibility_snapshot, self._flags)
+            finally:
+                # Wait for the remaining images to be written
+                if self._writer is not None:
+                    self._record_queue.put(None)
+                    self._writer.join()
+                if self._viewer is not None:
+                    scene.node_tree.nodes.remove(self._viewer)
+                    scene.use_nodes = self._use_nodes
+        finally:
+            STATICSEQUENCE_OT_export._is_running = False
+
+    def _finish(self):
+        # Parallel shards write their own manifest for the parent to merge,
+        # otherwise merge into the manifest on disk
+        if self.shard_count > 1:
+            save_manifest(shard_manifest_path(self._manifest_path, self.shard_index), self._rendered)
+        else:
+            manifest = load_manifest(self._manifest_path)
+            manifest.update(self._rendered)
+            save_manifest(self._manifest_path, manifest)
+
+        if self._write_errors:
+            for error in self._write_errors:
+                self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+
+        return {'FINISHED'}
+
+    def execute(self, context):
+        if not self._setup(context):
+            return {'CANCELLED'}
+
+        try:
+            while self._render_next(context):
+                pass
+        finally:
+            self._restore(context)
+
+        result = self._finish()
+        if result == {'FINISHED'}:
+            self.report({'INFO'}, "Rendering complete.")
         
+        return result
+
+    def invoke(self, context, event):
+        # Render one mesh per timer tick so the UI stays responsive and the
+        # sequence can be cancelled with Esc
+        if not self._setup(context):
+            return {'CANCELLED'}
+
+        wm = context.window_manager
+        self._rendered_count = 0
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.progress_begin(0, len(self._meshes))
+        wm.modal_handler_add(self)
+
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._end_modal(context)
+            self._finish()
+            self.report({'WARNING'}, "Rendering cancelled.")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        try:
+            rendering = self._render_next(context)
+        except Exception:
+            self._end_modal(context)
+            raise
+
+        if rendering:
+            self._rendered_count += 1
+            context.window_manager.progress_update(self._rendered_count)
+            return {'RUNNING_MODAL'}
+
+        self._end_modal(context)
+        result = self._finish()
+        if result == {'FINISHED'}:
+            self.report({'INFO'}, "Rendering complete.")
+
+        return result
+
+    def cancel(self, context):
+        # Blender stopped the operator itself, e.g. on quit or file load
+        self._end_modal(context)
+        self._finish()
+
+    def _end_modal(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        self._restore(context)
+
+class STATICSEQUENCE_OT_export_parallel(Operator):
+    bl_idname = "static_sequence.export_parallel"
+    bl_label = "Begin Parallel Render Sequence"
+
+    @classmethod
+    def poll(cls, context):
+        # The scene is partly hidden while a sequence is running
+        return not STATICSEQUENCE_OT_export._is_running
+
+    def execute(self, context):
+        props = context.scene.static_sequence_exporter_props
+        num_processes = props.num_processes
+
+        # Resolve the output path now, relative paths would otherwise point
+        # next to the temporary .blend file
+        output_path = bpy.path.abspath(props.output_path)
+
+        if not os.path.exists(output_path):
+            self.report({'ERROR'}, f"Output path '{output_path}' does not exist.")
+            return {'CANCELLED'}
+
+        # HIP only honours its own variable to pin a process to a GPU
+        compute_device_type = props.compute_device_type
+        if compute_device_type == 'PREFERENCES':
+            addon = context.preferences.addons.get('cycles')
+            compute_device_type = addon.preferences.compute_device_type if addon else 'NONE'
+        visible_devices_var = "HIP_VISIBLE_DEVICES" if compute_device_type == 'HIP' else "CUDA_VISIBLE_DEVICES"
+
+        # Save a copy of the current scene for the background processes
+        temp_dir = tempfile.mkdtemp(prefix="static_sequence_")
+        temp_blend = os.path.join(temp_dir, "static_sequence.blend")
+
+        processes = []
+        try:
+            bpy.ops.wm.save_as_mainfile(filepath=temp_blend, copy=True)
+
+            # Start one background Blender per shard, each pinned to its own
+            # GPU. Without --python-exit-code a failing script exits with 0
+            for i in range(num_processes):
+                args = [
+                    bpy.app.binary_path, "-b", temp_blend,
+                    "--python-exit-code", "1", "-P", __file__, "--",
+                    "--shard", str(i),
+                    "--nshards", str(num_processes),
+                    "--output", output_path,
+                ]
+                env = {**os.environ, visible_devices_var: str(i)}
+                processes.append(subprocess.Popen(args, env=env))
+
+            # Wait for every shard to finish
+            failed = [i for i, process in enumerate(processes) if process.wait() != 0]
+        except BaseException:
+            # Don't leave shards rendering unattended
+            for process in processes:
+                if process.poll() is None:
+                    process.terminate()
+                    process.wait()
+            raise
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        # Collect what every shard rendered into the shared manifest
+        merge_shard_manifests(os.path.join(os.path.normpath(output_path), MANIFEST_NAME), num_processes)
+
+        if failed:
+            self.report({'ERROR'}, f"Render processes {failed} failed.")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, "Parallel rendering complete.")
+
         return {'FINISHED'}
 
 class STATICSEQUENCE_PT_export_panel(Panel):
@@ -135,22 +976,62 @@ class STATICSEQUENCE_PT_export_panel(Panel):
         layout.prop(props, "lighting_collection")
         layout.prop(props, "output_path")
         layout.prop(props, "use_cycles")
+        if props.use_cycles:
+            layout.prop(props, "compute_device_type")
+            layout.prop(props, "samples")
+            layout.prop(props, "use_denoising")
         layout.prop(props, "transparent_film")
+        layout.prop(props, "output_format")
+        layout.prop(props, "async_write")
         layout.prop(props, "camera_object")
+        layout.prop(props, "enable_frustum_cull")
+        layout.prop(props, "use_object_border")
+        layout.prop(props, "skip_unchanged")
         
         layout.operator("static_sequence.export", text="Begin Render Sequence")
 
+        layout.prop(props, "num_processes")
+        layout.operator("static_sequence.export_parallel", text="Begin Parallel Render Sequence")
+
 def register():
     bpy.utils.register_class(StaticSequenceExporterProperties)
     bpy.utils.register_class(STATICSEQUENCE_OT_export)
+    bpy.utils.register_class(STATICSEQUENCE_OT_export_parallel)
     bpy.utils.register_class(STATICSEQUENCE_PT_export_panel)
     bpy.types.Scene.static_sequence_exporter_props = PointerProperty(type=StaticSequenceExporterProperties)
 
 def unregister():
     bpy.utils.unregister_class(StaticSequenceExporterProperties)
     bpy.utils.unregister_class(STATICSEQUENCE_OT_export)
+    bpy.utils.unregister_class(STATICSEQUENCE_OT_export_parallel)
     bpy.utils.unregister_class(STATICSEQUENCE_PT_export_panel)
     del bpy.types.Scene.static_sequence_exporter_props
 
+def run_shard(argv):
+    # Entry point for the background processes started by
+    # STATICSEQUENCE_OT_export_parallel
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--shard", type=int, required=True)
+    parser.add_argument("--nshards", type=int, required=True)
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args(argv)
+
+    bpy.context.scene.static_sequence_exporter_props.output_path = args.output
+
+    # Operators that report an error raise RuntimeError when called from Python
+    try:
+        result = bpy.ops.static_sequence.export(shard_index=args.shard, shard_count=args.nshards)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    if result != {'FINISHED'}:
+        sys.exit(1)
+
 if __name__ == "__main__":
     register()
+
+    # Arguments after "--" are passed to the script by Blender
+    if "--" in sys.argv:
+        run_shard(sys.argv[sys.argv.index("--") + 1:])